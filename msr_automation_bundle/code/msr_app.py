@@ -1,8 +1,13 @@
 import streamlit as st
+import io
 import os
 import pandas as pd
 import plotly.express as px
-from msr_automator import normalize_columns, coalesce_root_cause, build_pivot, safe_get_col, load_config
+from msr_automator import (
+    read_tracker, normalize_columns, coerce_datetime, compute_root_cause_series, categorize_columns, downcast_numeric,
+    mean_by_category, monthly_counts, build_pivots,
+    safe_get_col, write_sheet, set_column_widths, load_config, EXCEL_WRITER_OPTIONS, HEADER_FORMAT
+)
 
 st.set_page_config(page_title="MSR Automation", layout="wide")
 
@@ -12,27 +17,26 @@ st.caption("Upload your Excel tracker and generate summarized MSR reports automa
 # --- Load Configuration ---
 config_path = os.path.join(os.path.dirname(__file__), "config.yaml")
 cfg = load_config(config_path)
-aliases = cfg.get("column_aliases", {})
+alias_index = cfg["_alias_index"]
 rc_rules = cfg.get("root_cause_rules", {})
 out_cfg = cfg.get("output", {})
 
-uploaded_file = st.file_uploader("Upload your Excel Tracker (.xlsx)", type=["xlsx"])
-
-if uploaded_file:
-    st.info("Processing file... please wait ⏳")
 
+@st.cache_data(show_spinner="Parsing tracker...")
+def load_and_prepare(file_bytes: bytes, alias_index: dict, rc_rules: dict):
+    """Read and enrich the uploaded tracker once; reruns reuse the cached frame."""
     # --- Read Excel ---
-    df = pd.read_excel(uploaded_file, sheet_name=0)
-    df = normalize_columns(df, aliases)
+    df = read_tracker(io.BytesIO(file_bytes))
+    df = normalize_columns(df, alias_index)
 
     # --- Convert date columns ---
     for date_col in ["opened_at", "resolved_at"]:
         if date_col in df.columns:
-            df[date_col] = pd.to_datetime(df[date_col], errors="coerce")
+            df[date_col] = coerce_datetime(df[date_col])
 
     # --- Determine root causes ---
     rc_col = safe_get_col(df, "root_cause")
-    df["RootCauseFinal"] = df.apply(lambda r: coalesce_root_cause(r, rc_col, rc_rules), axis=1)
+    df["RootCauseFinal"] = compute_root_cause_series(df, rc_col, rc_rules)
 
     # --- Compute MTTR ---
     if "opened_at" in df.columns and "resolved_at" in df.columns:
@@ -40,6 +44,22 @@ if uploaded_file:
     else:
         df["ResolutionTimeHours"] = None
 
+    # --- Shrink dtypes: categoricals for low-cardinality text, narrow numerics ---
+    df = downcast_numeric(categorize_columns(df))
+
+    # --- Filter columns: sorted, ordered categories double as the widget options ---
+    for col in ["type", "priority", "state"]:
+        df[col] = df[col].cat.reorder_categories(sorted(df[col].cat.categories), ordered=True)
+    return df
+
+
+uploaded_file = st.file_uploader("Upload your Excel Tracker (.xlsx)", type=["xlsx"])
+
+if uploaded_file:
+    st.info("Processing file... please wait ⏳")
+
+    df = load_and_prepare(uploaded_file.getvalue(), alias_index, rc_rules)
+
     # --- FILTERS SECTION ---
     st.markdown("### 🔍 Filters")
 
@@ -48,22 +68,22 @@ if uploaded_file:
     with col1:
         selected_type = st.multiselect(
             "Filter by Ticket Type",
-            sorted(df["type"].dropna().unique()),
-            default=sorted(df["type"].dropna().unique())
+            df["type"].cat.categories,
+            default=df["type"].cat.categories.tolist()
         )
 
     with col2:
         selected_priority = st.multiselect(
             "Filter by Priority",
-            sorted(df["priority"].dropna().unique()),
-            default=sorted(df["priority"].dropna().unique())
+            df["priority"].cat.categories,
+            default=df["priority"].cat.categories.tolist()
         )
 
     with col3:
         selected_state = st.multiselect(
             "Filter by State",
-            sorted(df["state"].dropna().unique()),
-            default=sorted(df["state"].dropna().unique())
+            df["state"].cat.categories,
+            default=df["state"].cat.categories.tolist()
         )
 
     with col4:
@@ -91,25 +111,23 @@ if uploaded_file:
             date_range_res = None
 
     # --- Apply filters ---
-    df_filtered = df.copy()
-    df_filtered = df_filtered[
-        (df_filtered["type"].isin(selected_type)) &
-        (df_filtered["priority"].isin(selected_priority)) &
-        (df_filtered["state"].isin(selected_state))
-    ]
+    mask = (
+        df["type"].isin(selected_type) &
+        df["priority"].isin(selected_priority) &
+        df["state"].isin(selected_state)
+    )
 
     if date_range_open and "opened_at" in df.columns:
         start_open, end_open = pd.to_datetime(date_range_open[0]), pd.to_datetime(date_range_open[1])
-        df_filtered = df_filtered[
-            (df_filtered["opened_at"] >= start_open) & (df_filtered["opened_at"] <= end_open)
-        ]
+        mask &= df["opened_at"].between(start_open, end_open)
 
     if date_range_res and "resolved_at" in df.columns:
         start_res, end_res = pd.to_datetime(date_range_res[0]), pd.to_datetime(date_range_res[1])
-        df_filtered = df_filtered[
-            (df_filtered["resolved_at"].isna()) |  # Include unresolved tickets
-            ((df_filtered["resolved_at"] >= start_res) & (df_filtered["resolved_at"] <= end_res))
-        ]
+        # Include unresolved tickets
+        mask &= df["resolved_at"].isna() | df["resolved_at"].between(start_res, end_res)
+
+    # Downstream code only reads from df_filtered, so no defensive copy is needed
+    df_filtered = df.loc[mask]
 
     st.success(f"Showing {len(df_filtered)} filtered records out of {len(df)} total tickets.")
 
@@ -118,7 +136,7 @@ if uploaded_file:
         "type","priority","state","category","subcategory",
         "RootCauseFinal","assignment_group","customer","sla_breached"
     ]
-    pivots = {col: build_pivot(df_filtered, col) for col in wanted}
+    pivots = build_pivots(df_filtered, wanted)
 
     # --- Show summaries interactively ---
     tab_titles = ["Overview", "MTTR", "Trends"] + list(pivots.keys())
@@ -133,8 +151,7 @@ if uploaded_file:
         st.subheader("⏱ Mean Time To Resolve (MTTR)")
         if "ResolutionTimeHours" in df_filtered.columns and not df_filtered["ResolutionTimeHours"].isna().all():
             mttr_summary = (
-                df_filtered.groupby("type")["ResolutionTimeHours"]
-                .mean()
+                mean_by_category(df_filtered["type"], df_filtered["ResolutionTimeHours"])
                 .reset_index()
                 .rename(columns={"ResolutionTimeHours": "Avg_Resolution_Hours"})
             )
@@ -158,10 +175,7 @@ if uploaded_file:
         st.subheader("📈 Monthly Ticket Trends")
 
         if "opened_at" in df_filtered.columns:
-            df_filtered["MonthOpened"] = df_filtered["opened_at"].dt.to_period("M").astype(str)
-            trend_opened = (
-                df_filtered.groupby("MonthOpened").size().reset_index(name="Opened_Tickets")
-            )
+            trend_opened = monthly_counts(df_filtered["opened_at"], "MonthOpened", "Opened_Tickets")
             chart_open = px.line(
                 trend_opened,
                 x="MonthOpened",
@@ -172,10 +186,7 @@ if uploaded_file:
             st.plotly_chart(chart_open, use_container_width=True)
 
         if "resolved_at" in df_filtered.columns:
-            df_filtered["MonthResolved"] = df_filtered["resolved_at"].dt.to_period("M").astype(str)
-            trend_resolved = (
-                df_filtered.groupby("MonthResolved").size().reset_index(name="Resolved_Tickets")
-            )
+            trend_resolved = monthly_counts(df_filtered["resolved_at"], "MonthResolved", "Resolved_Tickets")
             chart_res = px.line(
                 trend_resolved,
                 x="MonthResolved",
@@ -192,26 +203,37 @@ if uploaded_file:
             st.dataframe(pv, use_container_width=True)
 
     # --- Allow download ---
-    out_dir = os.path.join(os.path.dirname(__file__), "out")
-    os.makedirs(out_dir, exist_ok=True)
-    out_file = os.path.join(out_dir, "MSR_Summary.xlsx")
-
+    out_name = out_cfg.get("filename", "MSR_Summary.xlsx")
+    # The Details sheet carries the Trends month keys; only the exported copy gets them
+    details = df_filtered
+    for date_col, month_col in [("opened_at", "MonthOpened"), ("resolved_at", "MonthResolved")]:
+        if date_col in details.columns:
+            details = details.assign(**{month_col: details[date_col].dt.strftime("%Y-%m")})
+
+    buf = io.BytesIO()
     with pd.ExcelWriter(
-        out_file,
+        buf,
         engine="xlsxwriter",
-        engine_kwargs={"options": {"strings_to_urls": False}}
+        engine_kwargs={"options": EXCEL_WRITER_OPTIONS}
     ) as writer:
-        for col, pv in pivots.items():
-            pv.to_excel(writer, index=False, sheet_name=col[:31])
-        df_filtered.to_excel(writer, index=False, sheet_name="Details")
-
-    with open(out_file, "rb") as f:
-        st.download_button(
-            label="⬇️ Download Filtered MSR Summary",
-            data=f,
-            file_name="MSR_Summary.xlsx",
-            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-        )
+        header_fmt = writer.book.add_format(HEADER_FORMAT)
+        for sheet, frame in [*((col[:31], pv) for col, pv in pivots.items()), ("Details", details)]:
+            write_sheet(writer, frame, sheet, header_fmt)
+            set_column_widths(writer.sheets[sheet], frame.columns)
+    report = buf.getvalue()
+
+    if out_cfg.get("save_copy", False):
+        out_dir = os.path.join(os.path.dirname(__file__), "out")
+        os.makedirs(out_dir, exist_ok=True)
+        with open(os.path.join(out_dir, out_name), "wb") as f:
+            f.write(report)
+
+    st.download_button(
+        label="⬇️ Download Filtered MSR Summary",
+        data=report,
+        file_name=out_name,
+        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    )
 
     st.success("✅ MSR Summary generated successfully!")
 
@@ -1,12 +1,54 @@
 #!/usr/bin/env python3
 import argparse
+import io
 import os
 import sys
 import re
 import json
-from typing import Dict, List, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+import numpy as np
 import pandas as pd
 import yaml
+from pandas.tseries.api import guess_datetime_format
+
+try:
+    import hyperscan
+except ImportError:  # optional accelerator, see compile_root_cause_rules
+    hyperscan = None
+
+try:
+    import numba
+except ImportError:  # optional accelerator, see infer_many
+    numba = None
+
+try:
+    import pyarrow as pa
+except ImportError:  # optional accelerator, see write_sheet and _encode_lowered
+    pa = None
+
+try:
+    import fastexcel
+except ImportError:  # optional accelerator, see read_tracker
+    fastexcel = None
+
+# Low-cardinality text columns stored as categoricals, so filters and pivots
+# compare small integer codes instead of hashing strings.
+LOW_CARD_COLS = [
+    "type", "priority", "state", "category", "subcategory",
+    "RootCauseFinal", "assignment_group", "customer", "sla_breached"
+]
+
+# xlsxwriter options for report workbooks. constant_memory flushes each row as soon as
+# the next one starts, so sheets must be written row by row (see write_sheet).
+EXCEL_WRITER_OPTIONS = {
+    "strings_to_urls": False,
+    "constant_memory": True,
+    "default_date_format": "yyyy-mm-dd hh:mm:ss",
+}
+HEADER_FORMAT = {"bold": True, "border": 1, "align": "center", "valign": "top"}
 
 
 # ----------------- CONFIG LOADER -----------------
@@ -15,20 +57,63 @@ def load_config(path: str) -> dict:
     if not os.path.exists(path):
         raise FileNotFoundError(f"Configuration file not found: {path}")
     with open(path, "r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+        cfg = yaml.safe_load(f)
+    cfg["_alias_index"] = build_alias_index(cfg.get("column_aliases", {}))
+    return cfg
+
+
+def build_alias_index(aliases: Dict[str, List[str]]) -> Dict[str, Tuple[str, int]]:
+    """Map each normalized alias to its logical column and its preference rank."""
+    return {
+        cand.lower().strip(): (logical, rank)
+        for logical, candidates in aliases.items()
+        for rank, cand in enumerate(candidates)
+    }
 
 
 # ----------------- DATA HELPERS -----------------
-def normalize_columns(df: pd.DataFrame, aliases: Dict[str, List[str]]) -> pd.DataFrame:
-    """Normalize column names based on config aliases."""
-    lc_map = {c.lower().strip(): c for c in df.columns}
-    mapped = {}
-    for logical, candidates in aliases.items():
-        for cand in candidates:
-            if cand.lower().strip() in lc_map:
-                mapped[logical] = lc_map[cand.lower().strip()]
-                break
-    return df.rename(columns={v: k for k, v in mapped.items()})
+def read_tracker(source) -> pd.DataFrame:
+    """Read the first sheet of an Excel tracker (path or binary buffer)."""
+    if fastexcel is not None and pa is not None:
+        if hasattr(source, "read"):
+            source = io.BytesIO(source.read())  # fastexcel takes a path or bytes; keep a rewindable copy
+        try:
+            # fastexcel decodes cells straight into Arrow buffers instead of one Python object
+            # per cell. Strict coercion refuses mixed-type columns (1/2/3 plus "High", dates
+            # plus "TBD") rather than turning them into text; pandas keeps per-cell types there.
+            sheet = fastexcel.read_excel(source.getvalue() if hasattr(source, "getvalue") else source)
+            sheet = sheet.load_sheet(0, dtype_coercion="strict", schema_sample_rows=None)
+        except fastexcel.UnsupportedColumnTypeCombinationError:
+            sheet = None
+        # Blank or duplicate headers are named differently (Type_1 vs Type.1); let pandas name those
+        if sheet is not None and not _has_generated_headers(sheet.available_columns()):
+            return sheet.to_arrow().to_pandas()
+    return pd.read_excel(source, sheet_name=0, engine="calamine")
+
+
+def _has_generated_headers(columns) -> bool:
+    """Whether fastexcel had to make up a header name for a blank or repeated header cell."""
+    seen = set()
+    for info in columns:
+        # A repeat of "Type" becomes "Type_1"; "Level_2" alone is just a header
+        base = re.match(r"(.*)_\d+$", info.name)
+        if info.column_name_from == "generated" or (base and base.group(1) in seen):
+            return True
+        seen.add(info.name)
+    return False
+
+
+def normalize_columns(df: pd.DataFrame, alias_index: Dict[str, Tuple[str, int]]) -> pd.DataFrame:
+    """Normalize column names based on the alias index built by load_config."""
+    # Headers that differ only in case/whitespace collapse to the last one, as before
+    by_key = {col.lower().strip(): col for col in df.columns}
+    best = {}
+    for key, col in by_key.items():
+        hit = alias_index.get(key)
+        # Several columns may alias the same logical name; the earliest alias wins
+        if hit and (hit[0] not in best or hit[1] < best[hit[0]][1]):
+            best[hit[0]] = (col, hit[1])
+    return df.rename(columns={col: logical for logical, (col, _) in best.items()})
 
 
 def infer_root_cause(text: str, rules: Dict[str, List[str]]) -> Optional[str]:
@@ -36,20 +121,205 @@ def infer_root_cause(text: str, rules: Dict[str, List[str]]) -> Optional[str]:
     if not isinstance(text, str) or not text.strip():
         return None
     text_lower = text.lower()
-    for cause, kw_list in rules.items():
+    for cause, kw_list in compile_root_cause_rules(rules):
         for kw in kw_list:
             if kw in text_lower:
                 return cause
     return None
 
 
-def coalesce_root_cause(row, rc_col: Optional[str], rules: Dict[str, List[str]]):
-    """Use provided root cause if available, else infer from text."""
-    if rc_col and pd.notna(row.get(rc_col)):
-        val = str(row.get(rc_col)).strip()
-        if val:
-            return val
-    return infer_root_cause(row.get("short_description"), rules) or "Unspecified"
+@lru_cache(maxsize=None)
+def _compile_hyperscan(rules_key: Tuple[Tuple[str, Tuple[str, ...]], ...]):
+    """Compile every keyword into one Hyperscan database, tagged with its cause index."""
+    expressions, ids = [], []
+    for cause_id, (_, kw_list) in enumerate(rules_key):
+        for kw in kw_list:
+            expressions.append(re.escape(kw).encode("utf-8"))
+            ids.append(cause_id)
+    db = hyperscan.Database()
+    db.compile(
+        expressions=expressions,
+        ids=ids,
+        # Start-of-match is needed to drop matches that straddle two texts in the joined buffer
+        flags=[hyperscan.HS_FLAG_SOM_LEFTMOST] * len(expressions),
+    )
+    return db
+
+
+def compile_root_cause_rules(rules: Dict[str, List[str]]) -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    """Freeze rules into a hashable key and warm the matcher cache for them.
+
+    Keywords are lower-cased here, once; every matcher compares them case-sensitively
+    against lower-cased text, so all backends agree on non-ASCII and upper-case keywords.
+    """
+    rules_key = tuple(
+        (cause, tuple(kw.lower() for kw in kw_list)) for cause, kw_list in rules.items() if kw_list
+    )
+    if hyperscan is not None and rules_key:
+        _compile_hyperscan(rules_key)
+    return rules_key
+
+
+_NO_CAUSE = np.iinfo(np.int32).max
+# Rows x causes below which the per-cause regex scan finishes before the Numba kernel
+# is even loaded from its on-disk cache (~0.15s once per process)
+_NUMBA_MIN_WORK = 2_000_000
+
+
+def _lower_texts(texts: Sequence[str]) -> pd.Series:
+    """Lower-case texts as a string Series; non-string entries become missing."""
+    text = texts if isinstance(texts, pd.Series) else pd.Series(texts, dtype=object)
+    if text.dtype == object:
+        text = text.where(text.map(lambda v: isinstance(v, str)))
+    return text.astype("string").str.lower()
+
+
+def _encode_lowered(texts: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Lower-case texts into one contiguous UTF-8 byte buffer plus per-text offsets.
+
+    Non-string entries become empty texts. With pyarrow the buffer and offsets are
+    taken straight from the Arrow string array, without a Python loop over rows.
+    """
+    lowered = _lower_texts(texts).fillna("")
+    if pa is not None:
+        arr = pa.array(lowered, type=pa.large_string())
+        if isinstance(arr, pa.ChunkedArray):
+            arr = arr.combine_chunks()
+        _, offsets, data = arr.buffers()
+        offsets = np.frombuffer(offsets, dtype=np.int64)[arr.offset:arr.offset + len(arr) + 1]
+        buf = np.frombuffer(data, dtype=np.uint8) if data is not None else np.zeros(0, dtype=np.uint8)
+        return buf, offsets
+    encoded = [t.encode("utf-8") for t in lowered]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(b) for b in encoded], out=offsets[1:])
+    return np.frombuffer(b"".join(encoded), dtype=np.uint8), offsets
+
+
+@lru_cache(maxsize=None)
+def _build_automaton(rules_key: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Tuple[np.ndarray, np.ndarray]:
+    """Build a dense Aho-Corasick automaton over the UTF-8 keyword bytes.
+
+    Returns the (states x 256) transition table and, per state, the lowest cause id
+    whose keyword ends there (directly or through a suffix), or _NO_CAUSE.
+    """
+    children = [{}]
+    cause_at = [_NO_CAUSE]
+    for cause_id, (_, kw_list) in enumerate(rules_key):
+        for kw in kw_list:
+            state = 0
+            for byte in kw.encode("utf-8"):
+                if byte not in children[state]:
+                    children.append({})
+                    cause_at.append(_NO_CAUSE)
+                    children[state][byte] = len(children) - 1
+                state = children[state][byte]
+            cause_at[state] = min(cause_at[state], cause_id)
+
+    delta = np.zeros((len(children), 256), dtype=np.int32)
+    out = np.array(cause_at, dtype=np.int32)
+    fail = np.zeros(len(children), dtype=np.int32)
+    queue = deque()
+    for byte, nxt in children[0].items():
+        delta[0, byte] = nxt
+        queue.append(nxt)
+    # Breadth-first, so a state's fail target is always final before the state itself
+    while queue:
+        state = queue.popleft()
+        out[state] = min(out[state], out[fail[state]])
+        delta[state] = delta[fail[state]]
+        for byte, nxt in children[state].items():
+            fail[nxt] = delta[fail[state], byte]
+            delta[state, byte] = nxt
+            queue.append(nxt)
+    return delta, out
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _scan_automaton(buf, offsets, delta, out):
+        """Run the automaton over each text slice of buf; return the best cause id or -1."""
+        n = offsets.shape[0] - 1
+        result = np.full(n, -1, dtype=np.int32)
+        for i in range(n):
+            state = 0
+            best = _NO_CAUSE
+            for j in range(offsets[i], offsets[i + 1]):
+                state = delta[state, buf[j]]
+                if out[state] < best:
+                    best = out[state]
+                    if best == 0:
+                        break
+            if best != _NO_CAUSE:
+                result[i] = best
+        return result
+
+
+def infer_many(texts: Sequence[str], rules: Dict[str, List[str]]) -> np.ndarray:
+    """Infer root causes for many descriptions at once.
+
+    Returns the index of the first matching cause (in rule order) per text, or -1.
+    Uses a single Hyperscan pass over all texts when available, else a Numba-compiled
+    Aho-Corasick scan for large batches, else one regex scan per cause.
+    """
+    rules_key = compile_root_cause_rules(rules)
+    if not rules_key:
+        return np.full(len(texts), -1, dtype=np.int32)
+
+    if hyperscan is not None:
+        # One scan over all texts back to back; each match is mapped to its text by end offset
+        buf, offsets = _encode_lowered(texts)
+        cause_ids, starts, ends = [], [], []
+
+        def on_match(cause_id, start, end, flags, context):
+            cause_ids.append(cause_id)
+            starts.append(start)
+            ends.append(end)
+
+        _compile_hyperscan(rules_key).scan(buf.tobytes(), match_event_handler=on_match)
+        ends = np.asarray(ends, dtype=np.int64)
+        rows = np.searchsorted(offsets, ends, side="left") - 1
+        inside = np.asarray(starts, dtype=np.int64) >= offsets[rows]
+        best = np.full(len(texts), _NO_CAUSE, dtype=np.int32)
+        np.minimum.at(best, rows[inside], np.asarray(cause_ids, dtype=np.int32)[inside])
+        return np.where(best == _NO_CAUSE, -1, best).astype(np.int32)
+
+    if numba is not None and (_scan_automaton.signatures or len(texts) * len(rules_key) >= _NUMBA_MIN_WORK):
+        delta, out = _build_automaton(rules_key)
+        buf, offsets = _encode_lowered(texts)
+        return _scan_automaton(buf, offsets, delta, out)
+
+    lowered = _lower_texts(texts)
+    hits = np.column_stack([
+        lowered.str.contains("|".join(map(re.escape, kw_list)), regex=True)
+        .fillna(False)
+        .to_numpy(dtype=bool)
+        for _, kw_list in rules_key
+    ])
+    return np.where(hits.any(axis=1), hits.argmax(axis=1), -1).astype(np.int32)
+
+
+def compute_root_cause_series(df: pd.DataFrame, rc_col: Optional[str], rules: Dict[str, List[str]]) -> pd.Series:
+    """Use provided root cause where available, else infer from text (vectorized)."""
+    if rc_col:
+        given = df[rc_col].astype("string").str.strip().replace("", pd.NA)
+    else:
+        given = pd.Series(pd.NA, index=df.index, dtype="string")
+
+    causes = [cause for cause, kw_list in rules.items() if kw_list]
+    todo = given.isna()
+    if causes and "short_description" in df.columns and todo.any():
+        ids = infer_many(df.loc[todo, "short_description"], rules)
+        given[todo] = np.where(ids >= 0, np.array(causes, dtype=object)[ids], None)
+    return given.fillna("Unspecified")
+
+
+def coerce_datetime(values: pd.Series) -> pd.Series:
+    """Parse a date column with the format guessed from its first value; typed columns pass through."""
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values
+    first = values.first_valid_index()
+    fmt = guess_datetime_format(str(values[first])) if first is not None else None
+    return pd.to_datetime(values, format=fmt, errors="coerce")
 
 
 def safe_get_col(df, logical_name: str):
@@ -57,19 +327,119 @@ def safe_get_col(df, logical_name: str):
     return logical_name if logical_name in df.columns else None
 
 
+def categorize_columns(df: pd.DataFrame, cols: List[str] = LOW_CARD_COLS) -> pd.DataFrame:
+    """Convert low-cardinality columns to category dtype in place."""
+    for col in cols:
+        # Booleans are already one byte wide, nothing to gain
+        if col in df.columns and not pd.api.types.is_bool_dtype(df[col]):
+            df[col] = df[col].astype("category")
+    return df
+
+
+def downcast_numeric(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink integer columns to the smallest lossless dtype.
+
+    Floats are left alone: ResolutionTimeHours is exported verbatim in the Details
+    sheet, and float32 would show up there as rounding noise.
+    """
+    for col in df.select_dtypes("integer").columns:
+        df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def mean_by_category(keys: pd.Series, values: pd.Series) -> pd.Series:
+    """Mean of values per observed category of keys, aggregated on the integer category codes."""
+    if not isinstance(keys.dtype, pd.CategoricalDtype):
+        return values.groupby(keys, observed=True).mean().astype("float64")
+    codes = keys.cat.codes.to_numpy()
+    vals = values.to_numpy(dtype="float64", na_value=np.nan)
+    n = len(keys.cat.categories)
+    present = codes >= 0
+    valid = present & ~np.isnan(vals)
+    sums = np.bincount(codes[valid], weights=vals[valid], minlength=n)
+    counts = np.bincount(codes[valid], minlength=n)
+    observed = np.bincount(codes[present], minlength=n) > 0
+    with np.errstate(invalid="ignore", divide="ignore"):
+        means = sums / counts
+    return pd.Series(means[observed], index=keys.cat.categories[observed].rename(keys.name), name=values.name)
+
+
+def monthly_counts(dates: pd.Series, month_col: str, count_col: str) -> pd.DataFrame:
+    """Count non-null dates per calendar month ("YYYY-MM"), oldest month first."""
+    months = dates.to_numpy().astype("datetime64[M]")
+    # Months since 1970 as small ints: one bincount instead of sorting every row
+    ordinal = months[~np.isnat(months)].view("int64")
+    first = ordinal.min() if len(ordinal) else 0
+    counts = np.bincount(ordinal - first)
+    used = np.flatnonzero(counts)
+    keys = (used + first).astype("datetime64[M]")
+    return pd.DataFrame({month_col: np.datetime_as_string(keys, unit="M"), count_col: counts[used]})
+
+
 def build_pivot(df: pd.DataFrame, col: str) -> pd.DataFrame:
     """Build pivot table for a given column."""
     if col not in df.columns:
         return pd.DataFrame(columns=[col, "Count"])
-    pv = (
-        df.groupby(col, dropna=False)
-        .size()
-        .reset_index(name="Count")
-        .sort_values("Count", ascending=False)
-    )
+    counts = df[col].value_counts(dropna=False, sort=True)
+    # Categoricals report every category; keep only the values actually present
+    pv = counts[counts > 0].rename_axis(col).reset_index(name="Count")
     return pv
 
 
+def build_pivots(df: pd.DataFrame, cols: List[str]) -> Dict[str, pd.DataFrame]:
+    """Build pivot tables for several columns concurrently, keyed by column name."""
+    # The pivots are independent and pandas drops the GIL in its counting kernels
+    workers = min(len(cols), os.cpu_count() or 1)
+    if workers <= 1:
+        return {col: build_pivot(df, col) for col in cols}
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return dict(zip(cols, ex.map(lambda col: build_pivot(df, col), cols)))
+
+
+def write_sheet(writer: pd.ExcelWriter, df: pd.DataFrame, sheet_name: str, header_fmt=None) -> None:
+    """Write a DataFrame to a new sheet row by row (header included).
+
+    Pass a header_fmt created once per workbook to avoid one add_format per sheet.
+    """
+    ws = writer.book.add_worksheet(sheet_name)
+    if header_fmt is None:
+        header_fmt = writer.book.add_format(HEADER_FORMAT)
+    ws.write_row(0, 0, [str(c) for c in df.columns], header_fmt)
+    for r, row in enumerate(_iter_rows(df), start=1):
+        ws.write_row(r, 0, row)
+
+
+def _iter_rows(df: pd.DataFrame):
+    """Iterate the rows of df as sequences of plain Python values, None for missing cells."""
+    if pa is not None:
+        try:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+        except (pa.ArrowInvalid, pa.ArrowTypeError, ValueError):  # mixed-type or duplicate columns
+            pass
+        else:
+            # Convert column by column from Arrow buffers; nulls (and NaN/NaT) come back as None
+            return zip(*(_arrow_pylist(col) for col in table.columns))
+    # Blank out NaN/NaT so xlsxwriter writes empty cells instead of rejecting them
+    return (row.tolist() for row in df.astype(object).where(df.notna(), None).to_numpy())
+
+
+def _arrow_pylist(col) -> list:
+    """Convert an Arrow column to a list; categoricals are decoded first (much faster than per-value lookup)."""
+    if pa.types.is_dictionary(col.type):
+        col = col.cast(col.type.value_type)
+    return col.to_pylist()
+
+
+def set_column_widths(ws, columns: Sequence[str], width: int = 20, desc_width: int = 60) -> None:
+    """Size the used columns of a sheet, widening short_description where present."""
+    if len(columns) == 0:
+        return
+    ws.set_column(0, len(columns) - 1, width)
+    if "short_description" in columns:
+        idx = list(columns).index("short_description")
+        ws.set_column(idx, idx, desc_width)
+
+
 # ----------------- MAIN FUNCTION -----------------
 def main():
     ap = argparse.ArgumentParser(description="Automate MSR reporting from Excel tracker.")
@@ -90,7 +460,7 @@ def main():
     cfg = load_config(config_path)
 
     # --- Load configuration details ---
-    aliases = cfg.get("column_aliases", {})
+    alias_index = cfg["_alias_index"]
     rc_rules = cfg.get("root_cause_rules", {})
     out_cfg = cfg.get("output", {})
     add_charts = args.charts or bool(out_cfg.get("add_charts", False))
@@ -108,25 +478,27 @@ def main():
             raise FileNotFoundError(f"Input Excel not found at: {args.input} or {fallback_path}")
 
     # --- Read Excel safely ---
-    df = pd.read_excel(args.input, sheet_name=0)
+    df = read_tracker(args.input)
 
     # --- Normalize column names ---
-    df = normalize_columns(df, aliases)
+    df = normalize_columns(df, alias_index)
 
     # --- Determine root causes ---
     rc_col = safe_get_col(df, "root_cause")
-    df["RootCauseFinal"] = df.apply(lambda r: coalesce_root_cause(r, rc_col, rc_rules), axis=1)
+    df["RootCauseFinal"] = compute_root_cause_series(df, rc_col, rc_rules)
 
     # --- Clean type column ---
     if "type" in df.columns:
         df["type"] = df["type"].astype(str).str.strip().str.title()
 
+    df = downcast_numeric(categorize_columns(df))
+
     # --- Build pivot tables ---
     wanted = [
         "type", "priority", "state", "category", "subcategory",
         "RootCauseFinal", "assignment_group", "customer", "sla_breached"
     ]
-    pivots = {col: build_pivot(df, col) for col in wanted}
+    pivots = build_pivots(df, wanted)
 
     # --- Save output workbook ---
      # Always put the output inside the "out" folder next to this script
@@ -137,10 +509,9 @@ def main():
 
     os.makedirs(os.path.dirname(out_file), exist_ok=True)
 
-    with pd.ExcelWriter(out_file, engine="xlsxwriter", engine_kwargs={"options": {"strings_to_urls": False}}) as writer:
+    with pd.ExcelWriter(out_file, engine="xlsxwriter", engine_kwargs={"options": EXCEL_WRITER_OPTIONS}) as writer:
         total = len(df)
-        overview = pd.DataFrame({"Metric": ["Total Tickets"], "Value": [total]})
-        overview.to_excel(writer, index=False, sheet_name="Overview")
+        sheets = {"Overview": pd.DataFrame({"Metric": ["Total Tickets"], "Value": [total]})}
 
         sheet_order = out_cfg.get("sheets", [])
         name_map = {
@@ -157,8 +528,7 @@ def main():
 
         for sheet in sheet_order:
             key = name_map.get(sheet, sheet)
-            df_p = pivots.get(key, pd.DataFrame())
-            df_p.to_excel(writer, index=False, sheet_name=sheet)
+            sheets[sheet] = pivots.get(key, pd.DataFrame())
 
         # Details tab
         cols_keep = [
@@ -170,12 +540,13 @@ def main():
             ]
             if c in df.columns or c == "RootCauseFinal"
         ]
-        df[cols_keep].to_excel(writer, index=False, sheet_name="Details")
+        sheets["Details"] = df[cols_keep]
 
-        # Adjust formatting
-        for ws_name, ws in writer.sheets.items():
-            ws.set_column(0, 6, 20)
-            ws.set_column(6, 6, 60)
+        # Write and format each sheet, sharing one header format across the workbook
+        header_fmt = writer.book.add_format(HEADER_FORMAT)
+        for sheet, frame in sheets.items():
+            write_sheet(writer, frame, sheet, header_fmt)
+            set_column_widths(writer.sheets[sheet], frame.columns)
 
         # Optional charts
         if add_charts:
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Make the scripts in code/ importable as modules
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
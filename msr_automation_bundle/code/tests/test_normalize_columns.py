@@ -0,0 +1,16 @@
+import os
+
+import pandas as pd
+
+import msr_automator
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_case_duplicate_headers_do_not_create_duplicate_columns():
+    cfg = msr_automator.load_config(os.path.join(CODE_DIR, "config.yaml"))
+    df = pd.DataFrame(columns=["TYPE", "Status", "type", " Priority "])
+    out = msr_automator.normalize_columns(df, cfg["_alias_index"])
+    # The last of the case-duplicates is the one renamed, matching the original lookup
+    assert list(out.columns) == ["TYPE", "state", "type", "priority"]
+    assert out.columns.is_unique
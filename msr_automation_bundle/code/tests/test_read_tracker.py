@@ -0,0 +1,42 @@
+import datetime
+import io
+
+import pandas as pd
+import pytest
+import xlsxwriter
+
+import msr_automator
+
+
+def make_xlsx(header, rows):
+    buf = io.BytesIO()
+    wb = xlsxwriter.Workbook(buf)
+    ws = wb.add_worksheet()
+    ws.write_row(0, 0, header)
+    date_fmt = wb.add_format({"num_format": "yyyy-mm-dd"})
+    for r, row in enumerate(rows, start=1):
+        for c, value in enumerate(row):
+            if isinstance(value, datetime.datetime):
+                ws.write_datetime(r, c, value, date_fmt)
+            elif value is not None:
+                ws.write(r, c, value)
+    wb.close()
+    return buf.getvalue()
+
+
+CASES = {
+    "mixed_numbers_and_text": (["Type", "Priority"], [["a", 1], ["b", 2], ["c", "High"], ["d", 3]]),
+    "date_with_text": (["Type", "OpenedAt"], [["a", datetime.datetime(2024, 1, 5)], ["b", "TBD"]]),
+    "duplicate_and_blank_headers": (["Type", "Type", None, "Type_1"], [["a", "b", "x", "c"]]),
+    "blank_row": (["Type", "Count"], [["a", 1], [None, None], ["b", 2]]),
+}
+
+
+@pytest.mark.parametrize("case", CASES)
+def test_read_tracker_matches_pandas(case):
+    data = make_xlsx(*CASES[case])
+    got = msr_automator.read_tracker(io.BytesIO(data))
+    expected = pd.read_excel(io.BytesIO(data), sheet_name=0, engine="calamine")
+    assert list(got.columns) == list(expected.columns)
+    assert got.astype(object).where(got.notna(), None).values.tolist() == \
+        expected.astype(object).where(expected.notna(), None).values.tolist()
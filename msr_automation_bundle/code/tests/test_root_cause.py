@@ -0,0 +1,68 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import msr_automator
+
+CODE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SAMPLE = os.path.join(CODE_DIR, "..", "data", "msr_sample.xlsx")
+
+EDGE_TEXTS = [
+    None, "", "   ", 42, float("nan"),
+    "VPN DOWN",                         # upper case
+    "disk full, vpn flapping",          # two causes, rule order decides
+    "a", "ccess revoked",               # keyword split across two rows
+    "how to reset",                     # multi-word keyword
+    "ticket without any keyword",
+    "unïcode ßerver crash",
+]
+
+
+@pytest.fixture(scope="module")
+def cfg():
+    return msr_automator.load_config(os.path.join(CODE_DIR, "config.yaml"))
+
+
+@pytest.fixture(scope="module")
+def texts(cfg):
+    df = msr_automator.normalize_columns(msr_automator.read_tracker(SAMPLE), cfg["_alias_index"])
+    return pd.concat([df["short_description"].astype(object), pd.Series(EDGE_TEXTS, dtype=object)], ignore_index=True)
+
+
+BACKENDS = ["hyperscan", "numba", "regex"]
+
+
+def use_backend(backend, monkeypatch):
+    if backend in ("hyperscan", "numba") and getattr(msr_automator, backend) is None:
+        pytest.skip(f"{backend} not installed")
+    if backend != "hyperscan":
+        monkeypatch.setattr(msr_automator, "hyperscan", None)
+    if backend == "numba":
+        monkeypatch.setattr(msr_automator, "_NUMBA_MIN_WORK", 0)
+    if backend == "regex":
+        monkeypatch.setattr(msr_automator, "numba", None)
+
+
+def infer_causes(texts, rules):
+    causes = np.array([cause for cause, kw_list in rules.items() if kw_list], dtype=object)
+    ids = msr_automator.infer_many(texts, rules)
+    return np.where(ids >= 0, causes[ids], None).tolist()
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_infer_many_matches_infer_root_cause(backend, cfg, texts, monkeypatch):
+    use_backend(backend, monkeypatch)
+    rules = cfg["root_cause_rules"]
+    assert infer_causes(texts, rules) == [msr_automator.infer_root_cause(t, rules) for t in texts]
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_keywords_match_regardless_of_case(backend, monkeypatch):
+    use_backend(backend, monkeypatch)
+    rules = {"Failure": ["ÉCHEC"], "Server Error": ["Server"], "Unused": []}
+    texts = pd.Series(["échec du serveur", "ÉCHEC", "SERVER down", "Échec server", "ECHEC", None], dtype=object)
+    expected = ["Failure", "Failure", "Server Error", "Failure", None, None]
+    assert [msr_automator.infer_root_cause(t, rules) for t in texts] == expected
+    assert infer_causes(texts, rules) == expected